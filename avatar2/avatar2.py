@@ -35,10 +35,11 @@ class Avatar(Thread):
     """
 
     def __init__(self, arch=ARM, cpu_model=None, output_directory=None,
-                log_to_stdout=True):
+                log_to_stdout=True, enable_file_logging=True):
         super(Avatar, self).__init__()
 
         self.shutdowned = False
+        self.enable_file_logging = enable_file_logging
         try:
             signal.signal(signal.SIGINT, self.sigint_wrapper)
             self.sigint_handler = self.shutdown
@@ -1,4 +1,5 @@
-from .target import Target, TargetStates, action_valid_decorator_factory
+from .target import Target, TargetStates, TargetActionError, \
+    action_valid_decorator_factory
 from .dummy_target import DummyTarget
 from .openocd_target import *
 from .gdb_target import *
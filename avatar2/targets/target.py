@@ -1,40 +1,82 @@
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
+from os import environ
+from os.path import abspath
 from sys import version_info
 from functools import wraps
-from threading import Event
+from threading import Condition, Event
 from types import MethodType
 
-from enum import IntEnum
+from enum import IntFlag
 
 from ..watchmen import watch
 
+# Perf-sensitive users can disable the action state guards completely, either
+# with AVATAR_FAST=1 in the environment or by running python -O. Actions
+# called in the wrong state then hit the protocol directly, with whatever
+# behavior the endpoint shows for a mis-sequenced request.
+_FAST_MODE = bool(environ.get('AVATAR_FAST')) or not __debug__
 
-def action_valid_decorator_factory(state, protocol):
+
+class TargetActionError(RuntimeError):
+    """
+    Raised when an action is requested on a target whose required protocol
+    is undefined or whose current state does not allow the action.
+    """
+    pass
+
+
+def action_valid_decorator_factory(state_mask, protocol):
     """
     This decorator factory  is used to generate decorators which  verify that
-    requested actions on a target, such as step(), stop(), read_register(), 
+    requested actions on a target, such as step(), stop(), read_register(),
     write_register() and so on are actually executable.
 
-    :param state: A mask specifying the required state of the Target
-    :type state:  An entry of the Enum TargetStates
+    :param state_mask: A mask of the TargetStates in which the action is
+                       allowed; a single TargetStates member permits
+                       exactly that state
+    :type state_mask:  TargetStates or int
     :param protocol: The protocol required to execute the action.
     :type protocol: str
+
+    Note: the actions on the base Target inline this guard directly into
+    their bodies to avoid the extra call frame on hot paths; this factory
+    remains for the target-specific subclasses. In fast mode (AVATAR_FAST
+    or python -O) no wrapper is generated at all.
     """
+    if _FAST_MODE:
+        return lambda func: func
 
-    def decorator(func):
-        @wraps(func)
-        def check(self, *args, **kwargs):
-            if getattr(self.protocols, protocol) is None:
-                raise Exception(
-                    "%s() requested but %s is undefined." %
-                    (func.__name__, protocol))
-            if not self.state.value & state.value:
-                raise Exception("%s() requested but Target is %s" %
-                                (func.__name__, TargetStates(self.state).name))
-            return func(self, *args, **kwargs)
+    state_mask = int(state_mask)
+    if not protocol.isidentifier():
+        raise ValueError("Invalid protocol name %r" % protocol)
 
-        return check
+    def decorator(func):
+        # Build the messages once at decoration time; the guard itself only
+        # does the %-substitution of the state name on the failure path
+        msg_no_proto = ("%s() requested but %s is undefined."
+                        % (func.__name__, protocol))
+        msg_bad_state = "%s() requested but Target is %%s" % func.__name__
+
+        # Compile the wrapper once per decorated method. The state mask and
+        # the error messages are baked into the generated bytecode as
+        # constants, and the protocol is fetched by a plain attribute
+        # expression with an interned name - no per-call string hashing
+        # through getattr and no indirection through a lookup callable.
+        src = (
+            "def check(self, *args, **kwargs):\n"
+            "    if self.protocols.%s is None:\n"
+            "        raise TargetActionError(%r)\n"
+            "    if not self.state & %d:\n"
+            "        raise TargetActionError(%r %% _state_name(self.state, self.state))\n"
+            "    return func(self, *args, **kwargs)\n"
+            % (protocol, msg_no_proto, state_mask, msg_bad_state))
+        namespace = {'func': func,
+                     'TargetActionError': TargetActionError,
+                     '_state_name': _STATE_NAMES.get}
+        exec(src, namespace)
+
+        return wraps(func)(namespace['check'])
 
     return decorator
 
@@ -72,10 +114,22 @@ def synchronize_state(*states, **kwargs):
 
                 w = avatar.watchmen.add('UpdateState', when='after',
                                         callback=state_synchronize_cb)
-            if len(states) == 1:
-                ret = func(self, *args, **kwargs)
-            else:
-                ret = synchronize_state(*states[:-1])(func)(self, *args, **kwargs)
+            try:
+                if len(states) == 1:
+                    ret = func(self, *args, **kwargs)
+                else:
+                    ret = synchronize_state(*states[:-1])(func)(self, *args, **kwargs)
+            except Exception:
+                # The wrapped call can raise before any transition happens
+                # (e.g. from an action guard). Drop the watchman again, as
+                # otherwise it lingers and fires on a later, unrelated
+                # state transition.
+                if blocking is True:
+                    try:
+                        avatar.watchmen.remove_watchman('UpdateState', w)
+                    except ValueError:
+                        pass  # the callback already removed itself
+                raise
             if blocking is True:
                 if not (transition_optional == True and self.state == state):
                     state_reached.wait()
@@ -86,9 +140,12 @@ def synchronize_state(*states, **kwargs):
     return decorator
 
 
-class TargetStates(IntEnum):
+class TargetStates(IntFlag):
     """
     A simple Enum for the different states a target can be in.
+    The members are flags, so state masks such as
+    TargetStates.STOPPED | TargetStates.EXITED stay within the enum and
+    allowed-state checks boil down to a single bitwise and.
     """
     CREATED = 0x1
     INITIALIZED = 0x2
@@ -99,6 +156,66 @@ class TargetStates(IntEnum):
     NOT_RUNNING = INITIALIZED | STOPPED
     BREAKPOINT = SYNCING | STOPPED
 
+
+# Raw state masks for the guards inlined into the Target actions below.
+# Resolving these once at import time avoids both the extra wrapper frame of
+# action_valid_decorator_factory and the repeated enum attribute lookups on
+# every call of the hot register/memory paths.
+_CREATED = TargetStates.CREATED.value
+_INITIALIZED = TargetStates.INITIALIZED.value
+_STOPPED = TargetStates.STOPPED.value
+_RUNNING = TargetStates.RUNNING.value
+_SYNCING = TargetStates.SYNCING.value
+_EXITED = TargetStates.EXITED.value
+_NOT_RUNNING = TargetStates.NOT_RUNNING.value
+_BREAKPOINT = TargetStates.BREAKPOINT.value
+
+# The guard variants of the masks accept every state in fast mode; this
+# disables the inlined state checks without a per-call flag test (the
+# protocol None-checks stay, they are a single attribute load).
+if _FAST_MODE:
+    _STOPPED_GUARD = _RUNNING_GUARD = _NOT_RUNNING_GUARD = ~0
+else:
+    _STOPPED_GUARD = _STOPPED
+    _RUNNING_GUARD = _RUNNING
+    _NOT_RUNNING_GUARD = _NOT_RUNNING
+
+# int -> name table for the error paths; a plain dict lookup is considerably
+# cheaper than re-entering Enum.__call__ just to fetch a name.
+# (__members__ also covers the composite members, which plain iteration
+# over an IntFlag skips)
+_STATE_NAMES = {s.value: n for n, s in TargetStates.__members__.items()}
+
+# File handlers keyed on the resolved log path. Without the cache every
+# Target construction opens a fresh descriptor on the same file, which leaks
+# FDs when targets are recreated in a loop (e.g. after shutdown).
+_HANDLER_CACHE = {}
+
+# Formatters are stateless, one shared instance serves all target handlers
+_TARGET_FORMATTER = logging.Formatter(
+    '%(asctime)s | %(name)s.%(levelname)s | %(message)s')
+
+
+def _get_target_logger(avatar, name):
+    """
+    Returns the logger for a target, attaching the per-target file handler
+    on first use. Handlers are shared per log file, so re-created targets
+    reuse the already opened handler instead of stacking duplicates. File
+    logging can be turned off altogether by setting
+    avatar.enable_file_logging to False.
+    """
+    log = logging.getLogger(f'{avatar.log.name}.targets.{name}')
+    if getattr(avatar, 'enable_file_logging', True):
+        path = abspath(f'{avatar.output_directory}/{name}.log')
+        handler = _HANDLER_CACHE.get(path)
+        if handler is None:
+            handler = logging.FileHandler(path)
+            handler.setFormatter(_TARGET_FORMATTER)
+            _HANDLER_CACHE[path] = handler
+        if handler not in log.handlers:
+            log.addHandler(handler)
+    return log
+
 class TargetRegs(object):
     def __init__(self, target, register_dict):
         self._target = target
@@ -156,9 +273,28 @@ class TargetProtocolStore(object):
 
     def shutdown(self):
         """Shutsdown all the associated protocols"""
+        # Collect the distinct live protocol instances first (the same
+        # instance typically backs several protocol slots)
+        live = []
+        for p in sorted(self.protocols):
+            instance = getattr(self, p)
+            if instance is not None and instance not in live:
+                live.append(instance)
+
+        # Each shutdown may block on IPC (GDB disconnect, monitor close),
+        # so run them concurrently: the wall time becomes the slowest
+        # disconnect instead of the sum
+        if len(live) > 1:
+            with ThreadPoolExecutor(max_workers=len(live)) as executor:
+                list(executor.map(lambda instance: instance.shutdown(), live))
+        elif live:
+            live[0].shutdown()
+
+        # The instances are already shut down, null the attributes without
+        # re-triggering the refcounting shutdown in __setattr__
         for p in self.protocols:
-            #print("Unloading %s" % str(p))
-            setattr(self, p, None)
+            super(TargetProtocolStore, self).__setattr__(p, None)
+        self.unique_protocols = {}
 
     def __setattr__(self, name, value):
         if name == 'protocols' or name == 'unique_protocols':
@@ -193,10 +329,18 @@ class TargetProtocolStore(object):
 class Target(object):
     """The Target object is one of Avatars core concept, as Avatar orchestrate 
     different targets.
-    While the generic target has no implementation, it provides an insight over 
+    While the generic target has no implementation, it provides an insight over
     all the functions a Target MUST implement
     """
 
+    # The fixed attributes get a slot: multi-target setups keep dozens of
+    # targets alive and the slots make both the per-instance footprint and
+    # the attribute loads in the action guards cheaper. __dict__ is kept so
+    # that subclasses and config-defined attributes still work and
+    # dictify() keeps seeing them.
+    __slots__ = ('state', 'avatar', 'status', 'regs', 'protocols', 'log',
+                 '_arch', '_state_cv', '__dict__')
+
     def __init__(self, avatar, name=None):  # type: ('Avatar', str) -> None
         """
         Creates a new instance of a Target.
@@ -204,7 +348,7 @@ class Target(object):
         :param name: The name of this target, mainly for logging. This is optional and will be autogenerated otherwise.
         """
         super(Target, self).__init__()
-        self.state = TargetStates.CREATED
+        self.state = _CREATED
 
         self.avatar = avatar
         self.name = name if name else self._get_unique_name()
@@ -213,13 +357,10 @@ class Target(object):
         self._arch = avatar.arch
         self.protocols = TargetProtocolStore()
 
-        self.state = TargetStates.CREATED
+        self.state = _CREATED
+        self._state_cv = Condition()
 
-        self.log = logging.getLogger('%s.targets.%s' % (avatar.log.name, self.name))
-        log_file = logging.FileHandler('%s/%s.log' % (avatar.output_directory, self.name))
-        formatter = logging.Formatter('%(asctime)s | %(name)s.%(levelname)s | %(message)s')
-        log_file.setFormatter(formatter)
-        self.log.addHandler(log_file)
+        self.log = _get_target_logger(avatar, self.name)
 
         self.regs = TargetRegs(self, self._arch.registers)
 
@@ -265,34 +406,45 @@ class Target(object):
         self.protocols.shutdown()
 
     @watch('TargetCont')
-    @action_valid_decorator_factory(TargetStates.STOPPED, 'execution')
     @synchronize_state(TargetStates.RUNNING)
     def cont(self, blocking=True):
         """
         Continues the execution of the target
         :param blocking: if True, block until the target is RUNNING
         """
+        if self.protocols.execution is None:
+            raise TargetActionError("cont() requested but execution is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("cont() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         return self.protocols.execution.cont()
 
 
     @watch('TargetStop')
-    @action_valid_decorator_factory(TargetStates.RUNNING, 'execution')
     @synchronize_state(TargetStates.STOPPED, transition_optional=True)
     def stop(self, blocking=True):
+        if self.protocols.execution is None:
+            raise TargetActionError("stop() requested but execution is undefined.")
+        if not self.state & _RUNNING_GUARD:
+            raise TargetActionError("stop() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         return self.protocols.execution.stop()
 
     @watch('TargetStep')
-    @action_valid_decorator_factory(TargetStates.STOPPED, 'execution')
     @synchronize_state(TargetStates.RUNNING, TargetStates.STOPPED)
     def step(self, blocking=True):
         """
         Steps one instruction.
         :param blocking: if True, block until the target is STOPPED again
         """
+        if self.protocols.execution is None:
+            raise TargetActionError("step() requested but execution is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("step() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         return self.protocols.execution.step()
 
     @watch('TargetSetFile')
-    @action_valid_decorator_factory(TargetStates.STOPPED, 'execution')
     def set_file(self, elf):
         """
         Load an ELF file
@@ -300,6 +452,11 @@ class Target(object):
         :param elf: ELF file to load
         :returns: True on success else False
         """
+        if self.protocols.execution is None:
+            raise TargetActionError("set_file() requested but execution is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("set_file() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         if not hasattr(self.protocols.execution, 'set_file'):
             self.log.error('Protocol "' + type(self.protocols.execution).__name__ + '" does not support "set_file"')
             return False
@@ -307,13 +464,17 @@ class Target(object):
         return self.protocols.execution.set_file(elf)
 
     @watch('TargetDownload')
-    @action_valid_decorator_factory(TargetStates.STOPPED, 'execution')
     def download(self):
         """
         Download the loaded code to the Target
 
         :returns: True on success else False
         """
+        if self.protocols.execution is None:
+            raise TargetActionError("download() requested but execution is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("download() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         if not hasattr(self.protocols.execution, 'download'):
             self.log.error('Protocol "' + type(self.protocols.execution).__name__ + '" does not support "download"')
             return False
@@ -321,7 +482,6 @@ class Target(object):
         return self.protocols.execution.download()
 
     @watch('TargetGetSymbol')
-    @action_valid_decorator_factory(TargetStates.STOPPED, 'memory')
     def get_symbol(self, symbol):
         """
         Get the address of a symbol
@@ -329,6 +489,11 @@ class Target(object):
         :param symbol:    The name of a symbol whose address is wanted
         :returns:         (True, Address) on success else False
         """
+        if self.protocols.memory is None:
+            raise TargetActionError("get_symbol() requested but memory is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("get_symbol() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         return self.protocols.memory.get_symbol(symbol)
 
     @watch('TargetWriteMemory')
@@ -348,6 +513,14 @@ class Target(object):
         :param raw:       Specifies whether to write in raw or word mode
         :returns:         True on success else False
         """
+        return self._write_memory_raw(address, size, value, num_words, raw)
+
+    def _write_memory_raw(self, address, size, value, num_words=1, raw=False):
+        """
+        Fast-path version of write_memory: same forwarding semantics, but no
+        watchmen triggers and no state guard. The caller is responsible for
+        making sure the target is actually stopped.
+        """
         try:
             target_range = self.avatar.get_memory_range(address)
         except Exception as e:
@@ -357,22 +530,34 @@ class Target(object):
         target_range.forwarded_to != self:
             return target_range.forwarded_to.write_memory(address, size, value,
                                                           num_words, raw)
-        
+
         return self.protocols.memory.write_memory(address, size, value,
                                                   num_words, raw)
 
     @watch('TargetReadMemory')
-    @action_valid_decorator_factory(TargetStates.STOPPED, 'memory')
     def read_memory(self, address, size, num_words=1, raw=False):
         """
         Reading from memory of the target
 
-        :param address:     The address to read from 
+        :param address:     The address to read from
         :param size:        The size of a read word
         :param num_words:   The amount of words to read (default: 1)
         :param raw:         Whether the read memory is returned unprocessed
         :return:          The read memory
         """
+        if self.protocols.memory is None:
+            raise TargetActionError("read_memory() requested but memory is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("read_memory() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
+        return self._read_memory_raw(address, size, num_words, raw)
+
+    def _read_memory_raw(self, address, size, num_words=1, raw=False):
+        """
+        Fast-path version of read_memory: same forwarding semantics, but no
+        watchmen triggers and no state guard. The caller is responsible for
+        making sure the target is actually stopped.
+        """
         try:
             target_range = self.avatar.get_memory_range(address)
         except Exception as e:
@@ -382,9 +567,100 @@ class Target(object):
         target_range.forwarded_to != self:
             return target_range.forwarded_to.read_memory(address, size,
                                                          num_words, raw)
-        
+
         return self.protocols.memory.read_memory(address, size, num_words, raw)
 
+    @watch('TargetReadMemory')
+    def read_memory_into(self, address, out):
+        """
+        Bulk-read target memory into a preallocated writable buffer.
+
+        A memory snapshot of len(out) bytes is fetched with a single guarded
+        protocol transfer instead of one read_memory() call per word. If the
+        memory protocol exposes a read_into() primitive it is used directly;
+        otherwise the transfer falls back to one raw bulk read.
+
+        :param address: The address to read from
+        :param out:     A writable buffer (memoryview, bytearray, ...)
+        :return:        The number of bytes read
+        """
+        if self.protocols.memory is None:
+            raise TargetActionError(
+                "read_memory_into() requested but memory is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("read_memory_into() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
+        out = memoryview(out).cast('B')
+        if hasattr(self.protocols.memory, 'read_into'):
+            return self.protocols.memory.read_into(address, out)
+        data = self._read_memory_raw(address, 1, num_words=len(out), raw=True)
+        out[:len(data)] = data
+        return len(data)
+
+    @watch('TargetWriteMemory')
+    def write_memory_from(self, address, buf):
+        """
+        Bulk-write a buffer into target memory.
+
+        The whole buffer is pushed with a single guarded protocol transfer.
+        If the memory protocol exposes a write_from() primitive it is used
+        directly; otherwise the transfer falls back to one raw bulk write.
+
+        :param address: The address to write to
+        :param buf:     A readable buffer (bytes, memoryview, ...)
+        :returns:       True on success else False
+        """
+        if self.protocols.memory is None:
+            raise TargetActionError(
+                "write_memory_from() requested but memory is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("write_memory_from() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
+        buf = memoryview(buf).cast('B')
+        if hasattr(self.protocols.memory, 'write_from'):
+            return self.protocols.memory.write_from(address, buf)
+        return self._write_memory_raw(address, 1, bytes(buf),
+                                      num_words=len(buf), raw=True)
+
+    @watch('TargetSnapshot')
+    def snapshot(self, regs=None, mem_ranges=()):
+        """
+        Captures registers and memory ranges of a stopped target in one go.
+
+        Breakpoint handlers and snapshotters typically issue a burst of
+        read_register/read_memory calls; this method performs the guard
+        once and batches the transfers. If the underlying protocol exposes
+        a composite snapshot() primitive the whole request is handed down
+        as a single round-trip; otherwise the registers are read through
+        the raw fast path and every memory range with one bulk raw read.
+
+        :param regs:       An iterable of register names, or None for all
+                           registers known to the architecture
+        :param mem_ranges: An iterable of (address, size) tuples
+        :returns:          ({register: value}, [bytes, ...])
+        """
+        if self.protocols.registers is None:
+            raise TargetActionError(
+                "snapshot() requested but registers is undefined.")
+        if self.protocols.memory is None:
+            raise TargetActionError(
+                "snapshot() requested but memory is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("snapshot() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
+
+        if regs is None:
+            regs = list(self._arch.registers)
+
+        proto = self.protocols.registers
+        if proto is self.protocols.memory and hasattr(proto, 'snapshot'):
+            return proto.snapshot(regs=regs, mem_ranges=mem_ranges)
+
+        reg_vals = dict((r, self._read_register_raw(r)) for r in regs)
+        mem = [self._read_memory_raw(address, 1, num_words=size, raw=True)
+               for address, size in mem_ranges]
+        return reg_vals, mem
+
     @watch('TargetRegisterWrite')
     #@action_valid_decorator_factory(TargetStates.STOPPED, 'registers')
     def write_register(self, register, value):
@@ -394,6 +670,14 @@ class Target(object):
         :param register:     The name of the register
         :param value:        The actual value written to the register
         """
+        return self._write_register_raw(register, value)
+
+    def _write_register_raw(self, register, value):
+        """
+        Fast-path version of write_register: no watchmen triggers, no state
+        guard. Note that arch-specific write hooks (e.g. the ARMv7-M
+        thumb-bit fixup) listen on the watched write_register only.
+        """
         return self.protocols.registers.write_register(register, value)
 
     @watch('TargetRegisterRead')
@@ -405,10 +689,16 @@ class Target(object):
         :param register:     The name of the register
         :return:             The actual value read from the register
         """
+        return self._read_register_raw(register)
+
+    def _read_register_raw(self, register):
+        """
+        Fast-path version of read_register: no watchmen triggers, no state
+        guard. The caller is responsible for the target being stopped.
+        """
         return self.protocols.registers.read_register(register)
 
     @watch('TargetSetBreakpoint')
-    @action_valid_decorator_factory(TargetStates.NOT_RUNNING, 'execution')
     def set_breakpoint(self, line, hardware=False, temporary=False, regex=False,
                        condition=None, ignore_count=0, thread=0, **kwargs):
         """Inserts a breakpoint
@@ -420,6 +710,12 @@ class Target(object):
         :param int ignore_count: Amount of times the bp should be ignored
         :param int thread:    Threadno in which this breakpoints should be added
         """
+        if self.protocols.execution is None:
+            raise TargetActionError(
+                "set_breakpoint() requested but execution is undefined.")
+        if not self.state & _NOT_RUNNING_GUARD:
+            raise TargetActionError("set_breakpoint() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         return self.protocols.execution.set_breakpoint(line, hardware=hardware,
                                                   temporary=temporary,
                                                   regex=regex,
@@ -428,7 +724,6 @@ class Target(object):
                                                   thread=thread, **kwargs)
 
     @watch('TargetSetWatchPoint')
-    @action_valid_decorator_factory(TargetStates.NOT_RUNNING, 'execution')
     def set_watchpoint(self, variable, write=True, read=False):
         """Inserts a watchpoint
 
@@ -436,39 +731,64 @@ class Target(object):
         :param bool write:    Write watchpoint
         :param bool read:     Read watchpoint
         """
+        if self.protocols.execution is None:
+            raise TargetActionError(
+                "set_watchpoint() requested but execution is undefined.")
+        if not self.state & _NOT_RUNNING_GUARD:
+            raise TargetActionError("set_watchpoint() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         return self.protocols.execution.set_watchpoint(variable,
                                                   write=write,
                                                   read=read)
 
     @watch('TargetRemovebreakpoint')
-    @action_valid_decorator_factory(TargetStates.STOPPED, 'execution')
     def remove_breakpoint(self, bkptno):
         """Deletes a breakpoint"""
+        if self.protocols.execution is None:
+            raise TargetActionError(
+                "remove_breakpoint() requested but execution is undefined.")
+        if not self.state & _STOPPED_GUARD:
+            raise TargetActionError("remove_breakpoint() requested but Target is %s" %
+                            _STATE_NAMES.get(self.state, self.state))
         return self.protocols.execution.remove_breakpoint(bkptno)
 
     def update_state(self, state):
-        self.log.info("State changed to to %s" % TargetStates(state))
-        self.state = state
+        # Accept both TargetStates members and raw ints; the raw value is
+        # stored so the hot-path guards get away with plain int compares.
+        value = state.value if isinstance(state, TargetStates) else state
+        self.log.info("State changed to %s", _STATE_NAMES.get(value, value))
+        with self._state_cv:
+            self.state = value
+            self._state_cv.notify_all()
 
     @watch('TargetWait')
     def wait(self, state=TargetStates.STOPPED|TargetStates.EXITED):
 
-        if state & TargetStates.SYNCING:
+        state = int(state)
+        if state & _SYNCING:
             self.log.warn("Waiting on SYNCING-state - this could lead to races")
 
-        while True:
-            if self.state & state != 0 and \
-               (state & TargetStates.SYNCING or \
-                self.state & TargetStates.SYNCING == 0):
-                break
-            time.sleep(.001) # send thread a ms to sleep to free resources
+        cv = self._state_cv
+        with cv:
+            while True:
+                cur = int(self.state)
+                if cur & state != 0 and \
+                   (state & _SYNCING or cur & _SYNCING == 0):
+                    break
+                # The timeout is a safety-net for targets which assign
+                # self.state directly instead of going through update_state
+                cv.wait(.1)
 
     def get_status(self):
         """
         Returns useful information about the target as a dict.
+
+        The returned dict is a fresh snapshot: a monitoring thread can hold
+        on to it without seeing later updates half-applied, and mutating it
+        does not write back into the target.
         """
-        self.status['state'] = self.state
-        return self.status
+        # self.state is kept as a raw int internally; hand out the enum
+        return {**self.status, 'state': TargetStates(self.state)}
 
     def _get_unique_name(self, i=0):
         classname = type(self).__name__
@@ -489,8 +809,12 @@ class Target(object):
         pass
 
     # ##generic aliases##
+    # The read aliases point at the raw fast paths: no watchmen triggers and
+    # no state guard, for tight scripting loops which already know the
+    # target is stopped. The write aliases stay on the watched versions, as
+    # arch-specific write hooks (ARMv7-M) rely on the watchmen firing.
     wr = write_register
-    rr = read_register
-    rm = read_memory
+    rr = _read_register_raw
+    rm = _read_memory_raw
     wm = write_memory
     bp = set_breakpoint
@@ -28,6 +28,7 @@ class WatchedTypes(object):
         'TargetSetWatchPoint',
         'TargetRemovebreakpoint',
         'TargetWait',
+        'TargetSnapshot',
         'TargetSetFile',
         'TargetDownload',
         'TargetInjectInterrupt'
@@ -0,0 +1,226 @@
+import tempfile
+
+from avatar2 import Avatar
+from avatar2.targets import Target, TargetStates, TargetActionError
+
+from nose.tools import *
+
+
+class FakeMemoryProtocol(object):
+    """A stub memory protocol backed by a plain bytearray.
+    Only supports bulk raw transfers, like the fallback path uses them."""
+
+    def __init__(self, size=0x100):
+        self.mem = bytearray(i & 0xff for i in range(size))
+        self.read_calls = 0
+        self.write_calls = 0
+
+    def read_memory(self, address, wordsize=4, num_words=1, raw=False):
+        assert_equal(raw, True)
+        assert_equal(wordsize, 1)
+        self.read_calls += 1
+        return bytes(self.mem[address:address + num_words])
+
+    def write_memory(self, address, wordsize, val, num_words=1, raw=False):
+        assert_equal(raw, True)
+        assert_equal(wordsize, 1)
+        self.write_calls += 1
+        self.mem[address:address + len(val)] = val
+        return True
+
+    def read_register(self, reg):
+        return 0x41
+
+    def shutdown(self):
+        pass
+
+
+class FakeBulkProtocol(FakeMemoryProtocol):
+    """A stub protocol which additionally offers the optional
+    read_into/write_from primitives."""
+
+    def read_into(self, address, out):
+        self.read_calls += 1
+        out[:] = self.mem[address:address + len(out)]
+        return len(out)
+
+    def write_from(self, address, buf):
+        self.write_calls += 1
+        self.mem[address:address + len(buf)] = buf
+        return True
+
+
+def setup_target(proto):
+    avatar = Avatar(output_directory=tempfile.mkdtemp(suffix='_avatar_test'),
+                    log_to_stdout=False)
+    target = Target(avatar, name='test_target')
+    target.protocols.set_all(proto)
+    target.update_state(TargetStates.STOPPED)
+    return avatar, target
+
+
+def test_read_memory_into_bulk_fallback():
+    proto = FakeMemoryProtocol()
+    avatar, target = setup_target(proto)
+
+    out = bytearray(16)
+    n = target.read_memory_into(0x10, out)
+
+    assert_equal(n, 16)
+    assert_equal(bytes(out), bytes(proto.mem[0x10:0x20]))
+    assert_equal(proto.read_calls, 1)
+
+    avatar.shutdown()
+
+
+def test_read_memory_into_short_read():
+    proto = FakeMemoryProtocol(size=0x20)
+    avatar, target = setup_target(proto)
+
+    # the protocol only has 8 bytes left at this address; the remainder of
+    # the buffer must stay untouched
+    out = bytearray(b'\xff' * 16)
+    n = target.read_memory_into(0x18, out)
+
+    assert_equal(n, 8)
+    assert_equal(bytes(out[:8]), bytes(proto.mem[0x18:0x20]))
+    assert_equal(bytes(out[8:]), b'\xff' * 8)
+
+    avatar.shutdown()
+
+
+def test_read_memory_into_primitive():
+    proto = FakeBulkProtocol()
+    avatar, target = setup_target(proto)
+
+    out = memoryview(bytearray(32))
+    n = target.read_memory_into(0x40, out)
+
+    assert_equal(n, 32)
+    assert_equal(bytes(out), bytes(proto.mem[0x40:0x60]))
+
+    avatar.shutdown()
+
+
+def test_write_memory_from_bulk_fallback():
+    proto = FakeMemoryProtocol()
+    avatar, target = setup_target(proto)
+
+    ret = target.write_memory_from(0x20, b'\xde\xad\xbe\xef')
+
+    assert_equal(ret, True)
+    assert_equal(bytes(proto.mem[0x20:0x24]), b'\xde\xad\xbe\xef')
+    assert_equal(proto.write_calls, 1)
+
+    avatar.shutdown()
+
+
+def test_write_memory_from_primitive():
+    proto = FakeBulkProtocol()
+    avatar, target = setup_target(proto)
+
+    ret = target.write_memory_from(0x20, bytearray(b'\x41' * 8))
+
+    assert_equal(ret, True)
+    assert_equal(bytes(proto.mem[0x20:0x28]), b'\x41' * 8)
+    assert_equal(proto.write_calls, 1)
+
+    avatar.shutdown()
+
+
+class FakeSnapshotProtocol(FakeMemoryProtocol):
+    """A stub protocol offering a composite snapshot primitive."""
+
+    def __init__(self, *args, **kwargs):
+        super(FakeSnapshotProtocol, self).__init__(*args, **kwargs)
+        self.snapshot_calls = 0
+
+    def snapshot(self, regs=None, mem_ranges=()):
+        self.snapshot_calls += 1
+        return {'r0': 0x1337}, [b'\x00']
+
+
+def test_snapshot_fallback():
+    proto = FakeMemoryProtocol()
+    avatar, target = setup_target(proto)
+
+    regs, mem = target.snapshot(regs=['r0', 'pc'],
+                                mem_ranges=[(0x10, 16), (0x40, 4)])
+
+    assert_equal(regs, {'r0': 0x41, 'pc': 0x41})
+    assert_equal(mem, [bytes(proto.mem[0x10:0x20]), bytes(proto.mem[0x40:0x44])])
+    # one bulk read per range, no per-word calls
+    assert_equal(proto.read_calls, 2)
+
+    avatar.shutdown()
+
+
+def test_snapshot_default_regs():
+    proto = FakeMemoryProtocol()
+    avatar, target = setup_target(proto)
+
+    regs, mem = target.snapshot()
+
+    # all registers known to the architecture, no memory ranges
+    assert_equal(sorted(regs), sorted(target._arch.registers))
+    assert_equal(mem, [])
+
+    avatar.shutdown()
+
+
+def test_snapshot_composite_primitive():
+    proto = FakeSnapshotProtocol()
+    avatar, target = setup_target(proto)
+
+    ret = target.snapshot(mem_ranges=[(0x0, 4)])
+
+    assert_equal(ret, ({'r0': 0x1337}, [b'\x00']))
+    assert_equal(proto.snapshot_calls, 1)
+    assert_equal(proto.read_calls, 0)
+
+    avatar.shutdown()
+
+
+def test_snapshot_guarded():
+    proto = FakeMemoryProtocol()
+    avatar, target = setup_target(proto)
+
+    # wrong state
+    target.update_state(TargetStates.RUNNING)
+    assert_raises(TargetActionError, target.snapshot)
+
+    # missing protocols
+    target.update_state(TargetStates.STOPPED)
+    target.protocols.registers = None
+    assert_raises(TargetActionError, target.snapshot)
+    target.protocols.registers = proto
+    target.protocols.memory = None
+    assert_raises(TargetActionError, target.snapshot)
+
+    avatar.shutdown()
+
+
+def test_bulk_transfers_guarded():
+    proto = FakeMemoryProtocol()
+    avatar, target = setup_target(proto)
+    target.update_state(TargetStates.RUNNING)
+
+    assert_raises(TargetActionError,
+                  target.read_memory_into, 0x0, bytearray(4))
+    assert_raises(TargetActionError,
+                  target.write_memory_from, 0x0, b'\x00')
+
+    avatar.shutdown()
+
+
+if __name__ == '__main__':
+    test_read_memory_into_bulk_fallback()
+    test_read_memory_into_short_read()
+    test_read_memory_into_primitive()
+    test_write_memory_from_bulk_fallback()
+    test_write_memory_from_primitive()
+    test_bulk_transfers_guarded()
+    test_snapshot_fallback()
+    test_snapshot_default_regs()
+    test_snapshot_composite_primitive()
+    test_snapshot_guarded()